@@ -0,0 +1,137 @@
+# MIT License
+#
+# Copyright (C) IBM Corporation 2019
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Compiled sampling kernels for the Laplace family of mechanisms, using numba when it is installed.
+
+Uniform random variates are passed in by the caller, so that samples follow the seeding of
+:func:`diffprivlib.utils.global_seed` and of each mechanism's own generator.
+"""
+import math
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    NUMBA_AVAILABLE = False
+    prange = range  # pylint: disable=invalid-name
+
+    def njit(*args, **kwargs):
+        """Stand-in for :func:`numba.njit` when numba is not installed, leaving the function uncompiled."""
+        del args, kwargs
+        return lambda func: func
+
+
+@njit(cache=True)
+def bounded_laplace_sample(value, scale, lower, upper, unif_rv):
+    """Samples the bounded-domain Laplace mechanism at `value` by inverting its CDF at `unif_rv`.
+
+    Parameters
+    ----------
+    value : float
+        The value to be randomised, with `lower` <= `value` <= `upper`.
+
+    scale : float
+        The scale of the Laplace distribution.  Must be strictly positive.
+
+    lower, upper : float
+        The bounds of the domain.
+
+    unif_rv : float
+        Uniform random variate on [0, 1).
+
+    Returns
+    -------
+    float
+        The randomised value.
+
+    """
+    # With lower <= value <= upper, the Laplace CDF at lower - value and upper - value each take a single branch
+    cdf_lower = 0.5 * math.exp((lower - value) / scale)
+    cdf_span = 1 - cdf_lower - 0.5 * math.exp((value - upper) / scale)
+
+    unif_rv = unif_rv * cdf_span + cdf_lower - 0.5
+    unif_rv = min(unif_rv, 0.5 - 1e-10)
+
+    return value + math.copysign(scale * math.log1p(-2 * abs(unif_rv)), unif_rv)
+
+
+@njit(cache=True, parallel=True)
+def bounded_laplace_batch(values, scale, lower, upper, unif_rv, *, out):
+    """Applies :func:`bounded_laplace_sample` elementwise, in parallel when compiled with numba.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        One-dimensional array of values to be randomised, each within [`lower`, `upper`].
+
+    scale : float
+        The scale of the Laplace distribution.  Must be strictly positive.
+
+    lower, upper : float
+        The bounds of the domain.
+
+    unif_rv : numpy.ndarray
+        Uniform random variates on [0, 1), of the same shape as `values`.
+
+    out : numpy.ndarray
+        Array of the same shape as `values` into which the randomised values are written.
+
+    Returns
+    -------
+    numpy.ndarray
+        `out`, holding the randomised values.
+
+    """
+    # Samples are iid, so each element is drawn independently across threads
+    for i in prange(values.shape[0]):
+        out[i] = bounded_laplace_sample(values[i], scale, lower, upper, unif_rv[i])
+
+    return out
+
+
+@njit(cache=True)
+def bounded_noise_sample(value, scale, cdf_lower, cdf_span, unif_rv):
+    """Samples the Laplace mechanism with bounded noise at `value` by inverting its truncated CDF at `unif_rv`.
+
+    Parameters
+    ----------
+    value : float
+        The value to be randomised.
+
+    scale : float
+        The scale of the Laplace distribution.
+
+    cdf_lower : float
+        The Laplace CDF at the lower noise bound.
+
+    cdf_span : float
+        The Laplace probability mass between the noise bounds.
+
+    unif_rv : float
+        Uniform random variate on [0, 1).
+
+    Returns
+    -------
+    float
+        The randomised value.
+
+    """
+    unif_rv = unif_rv * cdf_span + cdf_lower - 0.5
+
+    return value + math.copysign(scale * math.log1p(-2 * abs(unif_rv)), unif_rv)
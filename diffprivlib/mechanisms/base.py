@@ -22,6 +22,8 @@ import abc
 from copy import copy, deepcopy
 from numbers import Real
 
+import numpy as np
+
 
 class DPMachine(abc.ABC):
     """
@@ -341,9 +343,34 @@ class TruncationAndFoldingMixin:
         return value
 
     def _fold(self, value):
-        if value < self._lower_bound:
-            return self._fold(2 * self._lower_bound - value)
-        if value > self._upper_bound:
-            return self._fold(2 * self._upper_bound - value)
+        if self._lower_bound <= value <= self._upper_bound:
+            return value
 
-        return value
+        diam = self._upper_bound - self._lower_bound
+
+        if diam == 0:
+            return self._lower_bound
+
+        if diam == float("inf"):
+            # At most one bound is finite, so a single reflection suffices
+            return 2 * self._lower_bound - value if value < self._lower_bound else 2 * self._upper_bound - value
+
+        # Repeated reflection about the bounds is a triangle wave of period 2 * diam
+        folded = self._lower_bound + diam - abs((value - self._lower_bound) % (2 * diam) - diam)
+
+        # Guard against rounding past the bounds
+        return self._truncate(folded)
+
+    def _fold_batch(self, values):
+        diam = self._upper_bound - self._lower_bound
+
+        if diam == 0:
+            return np.full_like(values, self._lower_bound)
+
+        if np.isinf(diam):
+            values = np.where(values < self._lower_bound, 2 * self._lower_bound - values, values)
+            return np.where(values > self._upper_bound, 2 * self._upper_bound - values, values)
+
+        folded = self._lower_bound + diam - np.abs(np.mod(values - self._lower_bound, 2 * diam) - diam)
+
+        return np.clip(folded, self._lower_bound, self._upper_bound, out=folded)
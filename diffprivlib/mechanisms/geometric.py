@@ -18,6 +18,7 @@
 """
 The classic geometric mechanism for differential privacy, and its derivatives.
 """
+import math
 from numbers import Integral
 
 import numpy as np
@@ -156,11 +157,10 @@ class Geometric(DPMechanism):
 
         # Need to account for overlap of 0-value between distributions of different sign
         unif_rv = random() - 0.5
-        unif_rv *= 1 + np.exp(self._scale)
-        sgn = -1 if unif_rv < 0 else 1
+        unif_rv *= 1 + math.exp(self._scale)
 
         # Use formula for geometric distribution, with ratio of exp(-epsilon/sensitivity)
-        return int(np.round(value + sgn * np.floor(np.log(sgn * unif_rv) / self._scale)))
+        return int(np.round(value + math.copysign(math.floor(math.log(abs(unif_rv)) / self._scale), unif_rv)))
 
 
 class GeometricTruncated(Geometric, TruncationAndFoldingMixin):
@@ -18,13 +18,19 @@
 """
 The classic Laplace mechanism in differential privacy, and its derivatives.
 """
+import math
+from copy import deepcopy
 from numbers import Real
 
 import numpy as np
-from numpy.random import random
+from scipy import optimize
 
+from diffprivlib.mechanisms._laplace_kernels import NUMBA_AVAILABLE, bounded_laplace_batch, bounded_laplace_sample, \
+    bounded_noise_sample
 from diffprivlib.mechanisms.base import DPMechanism, TruncationAndFoldingMixin
-from diffprivlib.utils import copy_docstring
+from diffprivlib.utils import copy_docstring, _default_rng, _uniform_pool
+
+_REAL_TYPES = (float, int, np.floating, np.integer)
 
 
 class Laplace(DPMechanism):
@@ -41,6 +47,8 @@ class Laplace(DPMechanism):
     def __init__(self):
         super().__init__()
         self._sensitivity = None
+        self._scale = None
+        self._rng = None
 
     def __repr__(self):
         output = super().__repr__()
@@ -48,6 +56,11 @@ class Laplace(DPMechanism):
 
         return output
 
+    @copy_docstring(DPMechanism.set_epsilon_delta)
+    def set_epsilon_delta(self, epsilon, delta):
+        self._scale = None
+        return super().set_epsilon_delta(epsilon, delta)
+
     def set_sensitivity(self, sensitivity):
         """Sets the sensitivity of the mechanism.
 
@@ -67,9 +80,46 @@ class Laplace(DPMechanism):
         if sensitivity < 0:
             raise ValueError("Sensitivity must be non-negative")
 
+        self._scale = None
         self._sensitivity = float(sensitivity)
         return self
 
+    def set_rng(self, rng):
+        """Sets the random number generator used by the mechanism.
+
+        Parameters
+        ----------
+        rng : None or int or numpy.random.Generator
+            Seed or generator from which the mechanism draws its noise.  If `None`, the library's default generator is
+            used, which is seeded by :func:`.global_seed`.
+
+            A deep copy of the mechanism draws from a new stream seeded from this generator, so that the copy does not
+            repeat the original's noise.
+
+        Returns
+        -------
+        self : class
+
+        """
+        self._rng = None if rng is None else np.random.default_rng(rng)
+        return self
+
+    def _get_rng(self):
+        return _default_rng if self._rng is None else self._rng
+
+    def __deepcopy__(self, memo):
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+
+        for key, value in self.__dict__.items():
+            if key != "_rng":
+                setattr(copied, key, deepcopy(value, memo))
+
+        # Copying the generator's state would have both mechanisms release identical noise
+        copied._rng = None if self._rng is None else np.random.default_rng(self._rng.integers(2 ** 63, size=4))
+
+        return copied
+
     def check_inputs(self, value):
         """Checks that all parameters of the mechanism have been initialised correctly, and that the mechanism is ready
         to be used.
@@ -91,7 +141,8 @@ class Laplace(DPMechanism):
         """
         super().check_inputs(value)
 
-        if not isinstance(value, Real):
+        # Check the concrete numeric types first, as the numbers.Real ABC check is comparatively slow
+        if not isinstance(value, _REAL_TYPES) and not isinstance(value, Real):
             raise TypeError("Value to be randomised must be a number")
 
         if self._sensitivity is None:
@@ -99,6 +150,14 @@ class Laplace(DPMechanism):
 
         return True
 
+    def _prepare(self):
+        # Caches the scale, and any other constants derived from the parameters, once check_inputs has passed
+        if self._scale is None:
+            self._scale = self._find_scale()
+
+    def _find_scale(self):
+        return self._sensitivity / (self._epsilon - np.log1p(-self._delta))
+
     def get_bias(self, value):
         """Returns the bias of the mechanism at a given `value`.
 
@@ -130,8 +189,9 @@ class Laplace(DPMechanism):
 
         """
         self.check_inputs(0)
+        self._prepare()
 
-        return 2 * (self._sensitivity / (self._epsilon - np.log(1 - self._delta))) ** 2
+        return 2 * self._scale ** 2
 
     def randomise(self, value):
         """Randomise `value` with the mechanism.
@@ -148,12 +208,38 @@ class Laplace(DPMechanism):
 
         """
         self.check_inputs(value)
+        self._prepare()
+
+        return self._get_rng().laplace(loc=value, scale=self._scale)
+
+    def _check_batch_inputs(self, values):
+        values = np.asarray(values)
+
+        if values.dtype.kind not in "biuf":
+            raise TypeError("Values to be randomised must be numeric")
+
+        self.check_inputs(0)
+        self._prepare()
+
+        return values.astype(float)
 
-        scale = self._sensitivity / (self._epsilon - np.log(1 - self._delta))
+    def randomise_batch(self, values):
+        """Randomise an array of `values` with the mechanism, drawing the noise for all elements at once.
+
+        Parameters
+        ----------
+        values : array_like
+            The values to be randomised.
+
+        Returns
+        -------
+        numpy.ndarray
+            The randomised values, of the same shape as `values`.
 
-        unif_rv = random() - 0.5
+        """
+        values = self._check_batch_inputs(values)
 
-        return value - scale * np.sign(unif_rv) * np.log(1 - 2 * np.abs(unif_rv))
+        return self._get_rng().laplace(loc=values, scale=self._scale)
 
 
 class LaplaceTruncated(Laplace, TruncationAndFoldingMixin):
@@ -174,23 +260,33 @@ class LaplaceTruncated(Laplace, TruncationAndFoldingMixin):
     @copy_docstring(Laplace.get_bias)
     def get_bias(self, value):
         self.check_inputs(value)
+        self._prepare()
+
+        return self._get_bias_unchecked(value)
 
-        shape = self._sensitivity / self._epsilon
+    def _get_bias_unchecked(self, value):
+        shape = self._scale
+        lower_exponent = (self._lower_bound - value) / shape
+        upper_exponent = (value - self._upper_bound) / shape
 
-        return shape / 2 * (np.exp((self._lower_bound - value) / shape) - np.exp((value - self._upper_bound) / shape))
+        # exp(lower_exponent) - exp(upper_exponent), factored with expm1 to avoid cancellation when the two are close
+        return shape / 2 * math.exp(max(lower_exponent, upper_exponent)) \
+            * math.copysign(-math.expm1(-abs(lower_exponent - upper_exponent)), lower_exponent - upper_exponent)
 
     @copy_docstring(Laplace.get_variance)
     def get_variance(self, value):
         self.check_inputs(value)
+        self._prepare()
 
-        shape = self._sensitivity / self._epsilon
+        shape = self._scale
+        expm1_lower = math.expm1((self._lower_bound - value) / shape)
+        expm1_upper = math.expm1((value - self._upper_bound) / shape)
 
-        variance = value ** 2 + shape * (self._lower_bound * np.exp((self._lower_bound - value) / shape)
-                                         - self._upper_bound * np.exp((value - self._upper_bound) / shape))
-        variance += (shape ** 2) * (2 - np.exp((self._lower_bound - value) / shape)
-                                    - np.exp((value - self._upper_bound) / shape))
+        variance = value ** 2 + shape * (self._lower_bound * (expm1_lower + 1) - self._upper_bound * (expm1_upper + 1))
+        variance -= (shape ** 2) * (expm1_lower + expm1_upper)
 
-        variance -= (self.get_bias(value) + value) ** 2
+        bias = shape / 2 * (expm1_lower - expm1_upper)
+        variance -= (bias + value) ** 2
 
         return variance
 
@@ -203,11 +299,14 @@ class LaplaceTruncated(Laplace, TruncationAndFoldingMixin):
 
     @copy_docstring(Laplace.randomise)
     def randomise(self, value):
-        TruncationAndFoldingMixin.check_inputs(self, value)
-
         noisy_value = super().randomise(value)
         return self._truncate(noisy_value)
 
+    @copy_docstring(Laplace.randomise_batch)
+    def randomise_batch(self, values):
+        noisy_values = super().randomise_batch(values)
+        return np.clip(noisy_values, self._lower_bound, self._upper_bound)
+
 
 class LaplaceFolded(Laplace, TruncationAndFoldingMixin):
     """
@@ -227,11 +326,17 @@ class LaplaceFolded(Laplace, TruncationAndFoldingMixin):
     @copy_docstring(Laplace.get_bias)
     def get_bias(self, value):
         self.check_inputs(value)
+        self._prepare()
 
-        shape = self._sensitivity / self._epsilon
+        shape = self._scale
+        lower_exponent = (self._lower_bound - value) / shape
+        upper_exponent = (self._upper_bound - value) / shape
 
-        bias = shape * (np.exp((self._lower_bound + self._upper_bound - 2 * value) / shape) - 1)
-        bias /= np.exp((self._lower_bound - value) / shape) + np.exp((self._upper_bound - value) / shape)
+        # shape * expm1(lower + upper) / (exp(lower) + exp(upper)), scaled by exp(-upper) so that no exponent is
+        # positive, with the numerator factored as in LaplaceTruncated to avoid overflow and cancellation
+        bias = shape * math.exp(max(lower_exponent, -upper_exponent)) \
+            * math.copysign(-math.expm1(-abs(lower_exponent + upper_exponent)), lower_exponent + upper_exponent)
+        bias /= 1 + math.exp(lower_exponent - upper_exponent)
 
         return bias
 
@@ -248,20 +353,24 @@ class LaplaceFolded(Laplace, TruncationAndFoldingMixin):
 
     @copy_docstring(Laplace.randomise)
     def randomise(self, value):
-        TruncationAndFoldingMixin.check_inputs(self, value)
-
         noisy_value = super().randomise(value)
         return self._fold(noisy_value)
 
+    @copy_docstring(Laplace.randomise_batch)
+    def randomise_batch(self, values):
+        noisy_values = super().randomise_batch(values)
+        return self._fold_batch(noisy_values)
+
 
 class LaplaceBoundedDomain(LaplaceTruncated):
     """
     The bounded Laplace mechanism on a bounded domain.  The mechanism draws values directly from the domain, without any
     post-processing.
     """
-    def __init__(self):
-        super().__init__()
+    @copy_docstring(TruncationAndFoldingMixin.set_bounds)
+    def set_bounds(self, lower, upper):
         self._scale = None
+        return super().set_bounds(lower, upper)
 
     def _find_scale(self):
         if self._epsilon is None or self._delta is None:
@@ -275,35 +384,86 @@ class LaplaceBoundedDomain(LaplaceTruncated):
         def _delta_c(shape):
             if shape == 0:
                 return 2.0
-            return (2 - np.exp(- delta_q / shape) - np.exp(- (diam - delta_q) / shape)) / (1 - np.exp(- diam / shape))
+            try:
+                return (math.expm1(- delta_q / shape) + math.expm1(- (diam - delta_q) / shape)) \
+                    / math.expm1(- diam / shape)
+            except (OverflowError, ZeroDivisionError):
+                # Only when delta_q > diam, where the ratio is -inf (as numpy would evaluate it)
+                return -math.inf
+
+        # Kept as a numpy float so that delta = 1 gives -inf rather than raising
+        log_delta = np.log1p(-delta)
 
         def _f(shape):
-            return delta_q / (eps - np.log(_delta_c(shape)) - np.log(1 - delta))
+            delta_c = _delta_c(shape)
+
+            # Follow np.log for non-positive delta_c, giving -inf at zero and nan below
+            if delta_c > 0:
+                log_delta_c = math.log(delta_c)
+            elif delta_c == 0:
+                log_delta_c = -math.inf
+            else:
+                log_delta_c = math.nan
+
+            return delta_q / (eps - log_delta_c - log_delta)
 
-        left = delta_q / (eps - np.log(1 - delta))
+        # The scale is the fixed point of _f, which is bracketed by [left, _f(left)]
+        left = delta_q / (eps - log_delta)
         right = _f(left)
+
+        if right == left:
+            return left
+
+        if (right - left) * (_f(right) - right) <= 0:
+            return optimize.brentq(lambda shape: _f(shape) - shape, left, right, xtol=np.finfo(float).tiny)
+
+        # No sign change across the bracket (possible when delta_q > diam), so bisect as brentq cannot be used
         old_interval_size = (right - left) * 2
 
         while old_interval_size > right - left:
             old_interval_size = right - left
             middle = (right + left) / 2
+            f_middle = _f(middle)
 
-            if _f(middle) >= middle:
+            if f_middle >= middle:
                 left = middle
-            if _f(middle) <= middle:
+            if f_middle <= middle:
                 right = middle
 
         return (right + left) / 2
 
-    def _cdf(self, value):
-        # Allow for infinite epsilon
-        if self._scale == 0:
-            return 0 if value < 0 else 1
+    @staticmethod
+    def _find_scale_batch(epsilons, delta, diam, delta_q):
+        # Vectorised counterpart of _find_scale, bisecting for all values of epsilon at once
+        epsilons = np.asarray(epsilons, dtype=float)
+        log_delta = np.log1p(-delta)
+
+        def _delta_c(shape):
+            delta_c = (np.expm1(- delta_q / shape) + np.expm1(- (diam - delta_q) / shape)) / np.expm1(- diam / shape)
+            return np.where(shape == 0, 2.0, delta_c)
 
-        if value < 0:
-            return 0.5 * np.exp(value / self._scale)
+        def _f(shape):
+            return delta_q / (epsilons - np.log(_delta_c(shape)) - log_delta)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            left = delta_q / (epsilons - log_delta)
+            right = _f(left)
+            old_interval_size = (right - left) * 2
+
+            # Each bisection stops independently once its interval no longer shrinks, as in the scalar loop
+            active = old_interval_size > right - left
+
+            while np.any(active):
+                old_interval_size = np.where(active, right - left, old_interval_size)
+                middle = (right + left) / 2
+                f_middle = _f(middle)
 
-        return 1 - 0.5 * np.exp(-value / self._scale)
+                left = np.where(active & (f_middle >= middle), middle, left)
+                right = np.where(active & (f_middle <= middle), middle, right)
+
+                active &= old_interval_size > right - left
+
+        return (right + left) / 2
 
     def get_effective_epsilon(self):
         r"""Gets the effective epsilon of the mechanism, only for strict :math:`\epsilon`-differential privacy.  Returns
@@ -315,67 +475,88 @@ class LaplaceBoundedDomain(LaplaceTruncated):
             The effective :math:`\epsilon` parameter of the mechanism.  Returns ``None`` if `delta` is non-zero.
 
         """
-        if self._scale is None:
-            self._scale = self._find_scale()
+        self.check_inputs(0)
+        self._prepare()
 
         if self._delta > 0.0:
             return None
 
         return self._sensitivity / self._scale
 
-    @copy_docstring(Laplace.get_bias)
-    def get_bias(self, value):
-        self.check_inputs(value)
-
-        if self._scale is None:
-            self._scale = self._find_scale()
-
-        bias = (self._scale - self._lower_bound + value) / 2 * np.exp((self._lower_bound - value) / self._scale) \
-            - (self._scale + self._upper_bound - value) / 2 * np.exp((value - self._upper_bound) / self._scale)
-        bias /= 1 - np.exp((self._lower_bound - value) / self._scale) / 2 \
-            - np.exp((value - self._upper_bound) / self._scale) / 2
+    def _get_bias_unchecked(self, value):
+        bias = (self._scale - self._lower_bound + value) / 2 * math.exp((self._lower_bound - value) / self._scale) \
+            - (self._scale + self._upper_bound - value) / 2 * math.exp((value - self._upper_bound) / self._scale)
+        bias /= - (math.expm1((self._lower_bound - value) / self._scale)
+                   + math.expm1((value - self._upper_bound) / self._scale)) / 2
 
         return bias
 
     @copy_docstring(Laplace.get_variance)
     def get_variance(self, value):
         self.check_inputs(value)
+        self._prepare()
 
-        if self._scale is None:
-            self._scale = self._find_scale()
+        shape = self._scale
+        expm1_lower = math.expm1((self._lower_bound - value) / shape)
+        expm1_upper = math.expm1((value - self._upper_bound) / shape)
+        exp_lower, exp_upper = expm1_lower + 1, expm1_upper + 1
+        normaliser = - (expm1_lower + expm1_upper) / 2
 
         variance = value**2
-        variance -= (np.exp((self._lower_bound - value) / self._scale) * (self._lower_bound ** 2)
-                     + np.exp((value - self._upper_bound) / self._scale) * (self._upper_bound ** 2)) / 2
-        variance += self._scale * (self._lower_bound * np.exp((self._lower_bound - value) / self._scale)
-                                   - self._upper_bound * np.exp((value - self._upper_bound) / self._scale))
-        variance += (self._scale ** 2) * (2 - np.exp((self._lower_bound - value) / self._scale)
-                                          - np.exp((value - self._upper_bound) / self._scale))
-        variance /= 1 - (np.exp(-(value - self._lower_bound) / self._scale)
-                         + np.exp(-(self._upper_bound - value) / self._scale)) / 2
+        variance -= (exp_lower * (self._lower_bound ** 2) + exp_upper * (self._upper_bound ** 2)) / 2
+        variance += shape * (self._lower_bound * exp_lower - self._upper_bound * exp_upper)
+        variance -= (shape ** 2) * (expm1_lower + expm1_upper)
+        variance /= normaliser
 
-        variance -= (self.get_bias(value) + value) ** 2
+        bias = ((shape - self._lower_bound + value) / 2 * exp_lower
+                - (shape + self._upper_bound - value) / 2 * exp_upper) / normaliser
+        variance -= (bias + value) ** 2
 
         return variance
 
     @copy_docstring(Laplace.randomise)
     def randomise(self, value):
         self.check_inputs(value)
-
-        if self._scale is None:
-            self._scale = self._find_scale()
+        self._prepare()
 
         value = min(value, self._upper_bound)
         value = max(value, self._lower_bound)
 
-        unif_rv = random()
-        unif_rv *= self._cdf(self._upper_bound - value) - self._cdf(self._lower_bound - value)
-        unif_rv += self._cdf(self._lower_bound - value)
+        # Allow for infinite epsilon
+        if self._scale == 0:
+            return float(value)
+
+        unif_rv = _uniform_pool.draw() if self._rng is None else self._rng.random()
+
+        return bounded_laplace_sample(float(value), self._scale, self._lower_bound, self._upper_bound, unif_rv)
+
+    @copy_docstring(Laplace.randomise_batch)
+    def randomise_batch(self, values):
+        values = self._check_batch_inputs(values)
+
+        values = np.clip(values, self._lower_bound, self._upper_bound)
+
+        # Allow for infinite epsilon
+        if self._scale == 0:
+            return values
+
+        unif_rv = self._get_rng().random(values.shape)
+
+        if NUMBA_AVAILABLE:
+            out = np.empty(values.shape)
+            bounded_laplace_batch(values.ravel(), self._scale, self._lower_bound, self._upper_bound, unif_rv.ravel(),
+                                  out=out.ravel())
+            return out
+
+        cdf_lower = 0.5 * np.exp((self._lower_bound - values) / self._scale)
+
+        unif_rv *= 1 - cdf_lower - 0.5 * np.exp((values - self._upper_bound) / self._scale)
+        unif_rv += cdf_lower
         unif_rv -= 0.5
 
-        unif_rv = min(unif_rv, 0.5 - 1e-10)
+        unif_rv = np.minimum(unif_rv, 0.5 - 1e-10)
 
-        return value - self._scale * np.sign(unif_rv) * np.log(1 - 2 * np.abs(unif_rv))
+        return values + np.copysign(self._scale * np.log1p(-2 * np.abs(unif_rv)), unif_rv)
 
 
 class LaplaceBoundedNoise(Laplace):
@@ -384,8 +565,9 @@ class LaplaceBoundedNoise(Laplace):
     """
     def __init__(self):
         super().__init__()
-        self._scale = None
         self._noise_bound = None
+        self._cdf_lower = None
+        self._cdf_span = None
 
     def set_epsilon_delta(self, epsilon, delta):
         r"""Set the privacy parameters :math:`\epsilon` and :math:`\delta` for the mechanism.
@@ -415,16 +597,34 @@ class LaplaceBoundedNoise(Laplace):
         if isinstance(delta, Real) and not 0 < delta < 0.5:
             raise ValueError("Delta must be strictly in (0,0.5). For zero delta, use :class:`.Laplace`.")
 
-        return DPMechanism.set_epsilon_delta(self, epsilon, delta)
+        self._noise_bound = None
+        return super().set_epsilon_delta(epsilon, delta)
+
+    @copy_docstring(Laplace.set_sensitivity)
+    def set_sensitivity(self, sensitivity):
+        self._noise_bound = None
+        return super().set_sensitivity(sensitivity)
+
+    def _find_scale(self):
+        return self._sensitivity / self._epsilon
+
+    def _prepare(self):
+        super()._prepare()
+
+        if self._noise_bound is not None:
+            return
 
-    def _cdf(self, value):
         if self._scale == 0:
-            return 0 if value < 0 else 1
+            self._noise_bound = -1
+            self._cdf_lower, self._cdf_span = 0.5, 0.0
+            return
 
-        if value < 0:
-            return 0.5 * np.exp(value / self._scale)
+        self._noise_bound = self._scale * (self._epsilon + math.log(math.exp(-self._epsilon)
+                                                                    - math.expm1(-self._epsilon) / 2 / self._delta))
 
-        return 1 - 0.5 * np.exp(-value / self._scale)
+        # cdf(-noise_bound) and cdf(noise_bound) - cdf(-noise_bound), in closed form
+        self._cdf_lower = 0.5 * math.exp(- self._noise_bound / self._scale)
+        self._cdf_span = - math.expm1(- self._noise_bound / self._scale)
 
     @copy_docstring(Laplace.get_bias)
     def get_bias(self, value):
@@ -437,15 +637,19 @@ class LaplaceBoundedNoise(Laplace):
     @copy_docstring(Laplace.randomise)
     def randomise(self, value):
         self.check_inputs(value)
+        self._prepare()
+
+        unif_rv = _uniform_pool.draw() if self._rng is None else self._rng.random()
+
+        return bounded_noise_sample(float(value), self._scale, self._cdf_lower, self._cdf_span, unif_rv)
 
-        if self._scale is None or self._noise_bound is None:
-            self._scale = self._sensitivity / self._epsilon
-            self._noise_bound = -1 if self._scale == 0 else \
-                self._scale * np.log(1 + (np.exp(self._epsilon) - 1) / 2 / self._delta)
+    @copy_docstring(Laplace.randomise_batch)
+    def randomise_batch(self, values):
+        values = self._check_batch_inputs(values)
 
-        unif_rv = random()
-        unif_rv *= self._cdf(self._noise_bound) - self._cdf(- self._noise_bound)
-        unif_rv += self._cdf(- self._noise_bound)
+        unif_rv = self._get_rng().random(values.shape)
+        unif_rv *= self._cdf_span
+        unif_rv += self._cdf_lower
         unif_rv -= 0.5
 
-        return value - self._scale * (np.sign(unif_rv) * np.log(1 - 2 * np.abs(unif_rv)))
+        return values + np.copysign(self._scale * np.log1p(-2 * np.abs(unif_rv)), unif_rv)
@@ -22,7 +22,6 @@ import warnings
 from numbers import Real
 
 import numpy as np
-from numpy.random import geometric, random
 
 from diffprivlib.mechanisms.laplace import Laplace
 from diffprivlib.utils import copy_docstring
@@ -130,11 +129,29 @@ class Staircase(Laplace):
     def randomise(self, value):
         self.check_inputs(value)
 
-        sign = -1 if random() < 0.5 else 1
-        geometric_rv = geometric(1 - np.exp(- self._epsilon)) - 1
-        unif_rv = random()
-        binary_rv = 0 if random() < self._gamma / (self._gamma + (1 - self._gamma) * np.exp(- self._epsilon)) else 1
+        rng = self._get_rng()
+
+        sign = -1 if rng.random() < 0.5 else 1
+        geometric_rv = rng.geometric(1 - np.exp(- self._epsilon)) - 1
+        unif_rv = rng.random()
+        binary_rv = 0 if rng.random() < self._gamma / (self._gamma + (1 - self._gamma) * np.exp(- self._epsilon)) else 1
 
         return value + sign * ((1 - binary_rv) * ((geometric_rv + self._gamma * unif_rv) * self._sensitivity) +
                                binary_rv * ((geometric_rv + self._gamma + (1 - self._gamma) * unif_rv) *
                                             self._sensitivity))
+
+    @copy_docstring(Laplace.randomise_batch)
+    def randomise_batch(self, values):
+        values = self._check_batch_inputs(values)
+
+        rng = self._get_rng()
+        shape = values.shape
+
+        sign = np.where(rng.random(shape) < 0.5, -1, 1)
+        geometric_rv = rng.geometric(1 - np.exp(- self._epsilon), size=shape) - 1
+        unif_rv = rng.random(shape)
+        binary_rv = rng.random(shape) >= self._gamma / (self._gamma + (1 - self._gamma) * np.exp(- self._epsilon))
+
+        return values + sign * self._sensitivity * np.where(binary_rv,
+                                                            geometric_rv + self._gamma + (1 - self._gamma) * unif_rv,
+                                                            geometric_rv + self._gamma * unif_rv)
@@ -18,6 +18,8 @@
 """
 Basic functions and other utilities for the differential privacy library
 """
+import os
+import threading
 import warnings
 
 import numpy as np
@@ -39,6 +41,8 @@ def global_seed(seed):
 
     """
     np.random.seed(seed)
+    _default_rng.bit_generator.state = np.random.PCG64(seed).state
+    _uniform_pool.reset()
 
 
 def copy_docstring(source):
@@ -179,4 +183,58 @@ class DiffprivlibCompatibilityWarning(RuntimeWarning):
     """
 
 
+_default_rng = np.random.default_rng()
+
+
+class _UniformPool:
+    """Thread-safe pool of uniform random variates on [0, 1), drawn from the library's default PCG64 generator in blocks
+    to amortise the cost of single draws.
+
+    The pool is shared by all mechanisms (so copies of a mechanism never reuse variates), and is emptied by
+    :func:`global_seed` and in the child after a fork, so that reseeding takes effect immediately.
+
+    """
+    def __init__(self, size=4096):
+        self._size = size
+        self._pool = []
+        self._idx = 0
+        self._lock = threading.Lock()
+
+    def draw(self):
+        """Returns the next uniform random variate from the pool, refilling it if exhausted.
+
+        Returns
+        -------
+        float
+            Uniform random variate on [0, 1).
+
+        """
+        with self._lock:
+            if self._idx >= len(self._pool):
+                self._pool = _default_rng.random(self._size).tolist()
+                self._idx = 0
+
+            unif_rv = self._pool[self._idx]
+            self._idx += 1
+
+        return unif_rv
+
+    def reset(self):
+        """Discards any remaining variates in the pool.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            self._pool = []
+            self._idx = 0
+
+
+_uniform_pool = _UniformPool()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_uniform_pool.reset)
+
 warnings.simplefilter('always', PrivacyLeakWarning)
@@ -20,7 +20,7 @@ def get_version(file_path):
     raise RuntimeError("Unable to find version string.")
 
 
-install_requires = ['numpy >= 1.15.0',
+install_requires = ['numpy >= 1.17.0',
                     'setuptools >= 39.0.1',
                     'scikit-learn >= 0.22.0',
                     'scipy >= 1.2.1',
@@ -30,6 +30,8 @@ install_requires = ['numpy >= 1.15.0',
 docs_require = ['sphinx >= 1.4',
                 'sphinx_rtd_theme']
 
+numba_require = ['numba >= 0.53.0']
+
 setuptools.setup(name='diffprivlib',
                  version=get_version("diffprivlib/__init__.py"),
                  description='IBM Differential Privacy Library',
@@ -41,7 +43,8 @@ setuptools.setup(name='diffprivlib',
                  license='MIT',
                  install_requires=install_requires,
                  extras_require={
-                     'docs': docs_require
+                     'docs': docs_require,
+                     'numba': numba_require
                  },
                  python_requires='>=3',
                  classifiers=[
@@ -1,3 +1,4 @@
+from fractions import Fraction
 from unittest import TestCase
 import numpy as np
 
@@ -90,6 +91,15 @@ class TestLaplace(TestCase):
         with self.assertRaises(TypeError):
             self.mech.randomise("Hello")
 
+    def test_numeric_types(self):
+        self.mech.set_sensitivity(1).set_epsilon(1)
+
+        for value in [1, 1.5, np.int64(1), np.float32(1.5), Fraction(3, 2)]:
+            self.assertIsInstance(self.mech.randomise(value), float)
+
+        with self.assertRaises(TypeError):
+            self.mech.randomise(1 + 2j)
+
     def test_zero_median_prob(self):
         self.mech.set_sensitivity(1).set_epsilon(1)
         vals = []
@@ -127,3 +137,61 @@ class TestLaplace(TestCase):
 
         self.mech.set_epsilon(1).set_sensitivity(1)
         self.assertEqual(2.0, self.mech.get_variance(0))
+
+    def test_batch_shape(self):
+        self.mech.set_sensitivity(1).set_epsilon(1)
+        vals = self.mech.randomise_batch(np.zeros((10, 5)))
+
+        self.assertEqual(vals.shape, (10, 5))
+
+    def test_batch_non_numeric(self):
+        self.mech.set_sensitivity(1).set_epsilon(1)
+        with self.assertRaises(TypeError):
+            self.mech.randomise_batch(np.array(["Hello", "World"]))
+
+    def test_batch_no_params(self):
+        with self.assertRaises(ValueError):
+            self.mech.randomise_batch(np.zeros(10))
+
+    def test_batch_zero_median_prob(self):
+        self.mech.set_sensitivity(1).set_epsilon(1)
+        vals = self.mech.randomise_batch(np.zeros(10000))
+
+        median = float(np.median(vals))
+        self.assertAlmostEqual(np.abs(median), 0.0, delta=0.1)
+
+    def test_variance_after_reset(self):
+        self.mech.set_epsilon(1).set_sensitivity(1)
+        self.assertEqual(2.0, self.mech.get_variance(0))
+
+        self.mech.set_sensitivity(2)
+        self.assertEqual(8.0, self.mech.get_variance(0))
+
+        self.mech.set_epsilon(2)
+        self.assertEqual(2.0, self.mech.get_variance(0))
+
+    def test_set_rng_repeatable(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_rng(42)
+        vals0 = [self.mech.randomise(0) for _ in range(10)]
+
+        self.mech.set_rng(np.random.default_rng(42))
+        vals1 = [self.mech.randomise(0) for _ in range(10)]
+
+        self.assertEqual(vals0, vals1)
+
+    def test_deepcopy_independent(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_rng(1)
+        mech_copy = self.mech.deepcopy()
+
+        self.assertNotEqual(self.mech.randomise(0), mech_copy.randomise(0))
+        self.assertNotEqual(self.mech.randomise_batch(np.zeros(5))[0], mech_copy.randomise_batch(np.zeros(5))[0])
+
+    def test_global_seed_repeatable(self):
+        self.mech.set_sensitivity(1).set_epsilon(1)
+
+        global_seed(42)
+        vals0 = self.mech.randomise_batch(np.zeros(10))
+        global_seed(42)
+        vals1 = self.mech.randomise_batch(np.zeros(10))
+
+        self.assertTrue(np.all(vals0 == vals1))
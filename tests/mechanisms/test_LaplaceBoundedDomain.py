@@ -4,6 +4,7 @@ from unittest import TestCase
 import pytest
 
 from diffprivlib.mechanisms import LaplaceBoundedDomain
+from diffprivlib.mechanisms._laplace_kernels import bounded_laplace_batch, bounded_laplace_sample
 from diffprivlib.utils import global_seed
 
 
@@ -63,6 +64,11 @@ class TestLaplaceBoundedDomain(TestCase):
         with self.assertRaises(ValueError):
             self.mech.randomise(1)
 
+    def test_no_bounds_effective_epsilon(self):
+        self.mech.set_sensitivity(1).set_epsilon(1)
+        with self.assertRaisesRegex(ValueError, "Upper and lower bounds must be set"):
+            self.mech.get_effective_epsilon()
+
     def test_non_numeric(self):
         self.mech.set_sensitivity(1).set_epsilon(1).set_bounds(0, 1)
         with self.assertRaises(TypeError):
@@ -140,3 +146,106 @@ class TestLaplaceBoundedDomain(TestCase):
     def test_effective_epsilon_nonzero_delta(self):
         self.mech.set_epsilon_delta(1, 0.5).set_sensitivity(1).set_bounds(0, 10)
         self.assertIsNone(self.mech.get_effective_epsilon())
+
+    def test_batch_within_bounds(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_bounds(0, 1)
+        vals = self.mech.randomise_batch(np.linspace(-1, 2, 1000))
+
+        self.assertTrue(np.all(vals >= 0))
+        self.assertTrue(np.all(vals <= 1))
+
+    def test_batch_inf_epsilon(self):
+        self.mech.set_sensitivity(1).set_epsilon(float("inf")).set_bounds(0, 10)
+        vals = self.mech.randomise_batch(np.ones(1000))
+
+        self.assertTrue(np.all(vals == 1))
+
+    def test_batch_zero_median_prob(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_bounds(0, 1)
+        vals = self.mech.randomise_batch(np.full(10000, 0.5))
+
+        median = float(np.median(vals))
+        self.assertAlmostEqual(np.abs(median), 0.5, delta=0.1)
+
+    def test_effective_epsilon_after_reset(self):
+        self.mech.set_epsilon(1).set_sensitivity(1).set_bounds(0, 1)
+        self.assertEqual(self.mech.get_effective_epsilon(), 1.0)
+
+        self.mech.set_bounds(0, 10)
+        self.assertLess(self.mech.get_effective_epsilon(), 1.0)
+
+    def test_global_seed_repeatable(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_bounds(0, 1)
+
+        global_seed(42)
+        vals0 = [self.mech.randomise(0.5) for _ in range(10)]
+        global_seed(42)
+        vals1 = [self.mech.randomise(0.5) for _ in range(10)]
+
+        self.assertEqual(vals0, vals1)
+
+    def test_copy_independent(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_bounds(0, 1)
+        mech_copy = self.mech.copy()
+
+        self.assertNotEqual(self.mech.randomise(0.5), mech_copy.randomise(0.5))
+
+    def test_deepcopy_independent(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_bounds(0, 1).set_rng(1)
+        mech_copy = self.mech.deepcopy()
+        another_copy = self.mech.deepcopy()
+
+        vals = [self.mech.randomise(0.5), mech_copy.randomise(0.5), another_copy.randomise(0.5)]
+        self.assertEqual(len(set(vals)), 3)
+        self.assertEqual(mech_copy._epsilon, self.mech._epsilon)
+
+    def test_set_rng_repeatable(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_bounds(0, 1).set_rng(42)
+        vals0 = [self.mech.randomise(0.5) for _ in range(10)]
+
+        self.mech.set_rng(42)
+        vals1 = [self.mech.randomise(0.5) for _ in range(10)]
+
+        self.assertEqual(vals0, vals1)
+
+    def test_find_scale_batch(self):
+        epsilons = np.array([0.1, 0.5, 1, 2, float("inf")])
+        scales = LaplaceBoundedDomain._find_scale_batch(epsilons, 0.1, 10, 1)
+
+        for epsilon, scale in zip(epsilons, scales):
+            self.mech.set_epsilon_delta(epsilon, 0.1).set_sensitivity(1).set_bounds(0, 10)
+            self.assertAlmostEqual(scale, self.mech._find_scale())
+
+    def test_batch_kernel_matches_scalar(self):
+        values = np.linspace(0, 10, 101)
+        unif_rv = np.random.random(values.shape)
+        out = bounded_laplace_batch(values, 2.0, 0.0, 10.0, unif_rv, out=np.empty(values.shape))
+
+        for value, unif, noisy_value in zip(values, unif_rv, out):
+            self.assertAlmostEqual(noisy_value, bounded_laplace_sample(value, 2.0, 0.0, 10.0, unif))
+
+    def test_batch_fortran_order(self):
+        self.mech.set_epsilon(1).set_sensitivity(1).set_bounds(0, 10)
+        values = np.asfortranarray(np.arange(20, dtype=float).reshape(4, 5) / 2)
+        vals = self.mech.randomise_batch(values)
+
+        self.assertEqual(vals.shape, (4, 5))
+        self.assertTrue(np.all(vals >= 0))
+        self.assertTrue(np.all(vals <= 10))
+
+    def test_sensitivity_exceeds_domain(self):
+        self.mech.set_epsilon(1).set_sensitivity(2).set_bounds(0, 1.9)
+        self.assertAlmostEqual(self.mech._find_scale(), 1.9485005029646554)
+        self.assertTrue(0 <= self.mech.randomise(1) <= 1.9)
+
+        self.mech.set_epsilon_delta(0.001, 0.1).set_sensitivity(0.5).set_bounds(0, 0.1)
+        self.assertAlmostEqual(self.mech._find_scale(), 2.7286690237106477)
+        self.assertTrue(0 <= self.mech.randomise(0) <= 0.1)
+
+    def test_find_scale_batch_sensitivity_exceeds_domain(self):
+        epsilons = np.array([0.5, 1, 2, 10])
+        scales = LaplaceBoundedDomain._find_scale_batch(epsilons, 0.1, 1.9, 2)
+
+        for epsilon, scale in zip(epsilons, scales):
+            self.mech.set_epsilon_delta(epsilon, 0.1).set_sensitivity(2).set_bounds(0, 1.9)
+            self.assertAlmostEqual(scale, self.mech._find_scale())
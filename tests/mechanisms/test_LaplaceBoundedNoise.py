@@ -132,3 +132,36 @@ class TestLaplaceBoundedNoise(TestCase):
     def test_variance(self):
         self.mech.set_epsilon_delta(1, 0.1).set_sensitivity(1)
         self.assertRaises(NotImplementedError, self.mech.get_variance, 0)
+
+    def test_batch_within_bounds(self):
+        self.mech.set_sensitivity(1).set_epsilon_delta(1, 0.1)
+        vals = self.mech.randomise_batch(np.zeros(1000))
+
+        self.assertTrue(np.all(vals >= -self.mech._noise_bound))
+        self.assertTrue(np.all(vals <= self.mech._noise_bound))
+
+    def test_batch_zero_median_prob(self):
+        self.mech.set_sensitivity(1).set_epsilon_delta(1, 0.1)
+        vals = self.mech.randomise_batch(np.full(10000, 0.5))
+
+        median = float(np.median(vals))
+        self.assertAlmostEqual(np.abs(median), 0.5, delta=0.1)
+
+    def test_noise_bound_after_reset(self):
+        self.mech.set_sensitivity(1).set_epsilon_delta(1, 0.1)
+        self.mech.randomise(0)
+        noise_bound = self.mech._noise_bound
+
+        self.mech.set_sensitivity(2)
+        self.mech.randomise(0)
+        self.assertAlmostEqual(self.mech._noise_bound, 2 * noise_bound)
+
+    def test_global_seed_repeatable(self):
+        self.mech.set_sensitivity(1).set_epsilon_delta(1, 0.1)
+
+        global_seed(42)
+        vals0 = [self.mech.randomise(0) for _ in range(10)]
+        global_seed(42)
+        vals1 = [self.mech.randomise(0) for _ in range(10)]
+
+        self.assertEqual(vals0, vals1)
@@ -115,6 +115,45 @@ class TestLaplaceFolded(TestCase):
         self.assertGreater(self.mech.get_bias(0), 0.0)
         self.assertLess(self.mech.get_bias(1), 0.0)
 
+    def test_bias_wide_domain(self):
+        self.mech.set_epsilon(1).set_sensitivity(1).set_bounds(0, 1000)
+        self.assertAlmostEqual(self.mech.get_bias(0), 1.0)
+        self.assertAlmostEqual(self.mech.get_bias(1000), -1.0)
+        self.assertAlmostEqual(self.mech.get_bias(500), 0.0)
+
     def test_variance(self):
         self.mech.set_epsilon(1).set_sensitivity(1).set_bounds(0, 1)
         self.assertRaises(NotImplementedError, self.mech.get_variance, 0)
+
+    def test_batch_within_bounds(self):
+        self.mech.set_sensitivity(1).set_epsilon(0.1).set_bounds(0, 1)
+        vals = self.mech.randomise_batch(np.full(1000, 0.5))
+
+        self.assertTrue(np.all(vals >= 0))
+        self.assertTrue(np.all(vals <= 1))
+
+    def test_batch_semi_inf_domain(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_bounds(0, float("inf"))
+        vals = self.mech.randomise_batch(np.zeros(1000))
+
+        self.assertTrue(np.all(vals >= 0))
+
+    def test_batch_zero_median_prob(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_bounds(0, 1)
+        vals = self.mech.randomise_batch(np.full(10000, 0.5))
+
+        median = float(np.median(vals))
+        self.assertAlmostEqual(np.abs(median), 0.5, delta=0.1)
+
+    def test_fold_far_outside(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_bounds(0, 1)
+
+        self.assertAlmostEqual(self.mech._fold(10.25), 0.25)
+        self.assertAlmostEqual(self.mech._fold(-3.4), 0.6)
+        self.assertAlmostEqual(self.mech._fold(1e6 + 0.5), 0.5)
+
+    def test_zero_diameter(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_bounds(2, 2)
+
+        self.assertEqual(self.mech.randomise(2), 2)
+        self.assertTrue(np.all(self.mech.randomise_batch(np.full(10, 2.0)) == 2))
@@ -126,3 +126,17 @@ class TestLaplaceTruncated(TestCase):
     def test_variance(self):
         self.mech.set_epsilon(1).set_sensitivity(1).set_bounds(0, 1)
         self.assertGreater(self.mech.get_variance(0), 0.0)
+
+    def test_batch_within_bounds(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_bounds(0, 1)
+        vals = self.mech.randomise_batch(np.full(1000, 0.5))
+
+        self.assertTrue(np.all(vals >= 0))
+        self.assertTrue(np.all(vals <= 1))
+
+    def test_batch_zero_median_prob(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_bounds(0, 1)
+        vals = self.mech.randomise_batch(np.full(10000, 0.5))
+
+        median = float(np.median(vals))
+        self.assertAlmostEqual(np.abs(median), 0.5, delta=0.1)
@@ -1,6 +1,8 @@
 import numpy as np
 from unittest import TestCase
 
+from scipy.stats import ks_2samp
+
 from diffprivlib.mechanisms import Staircase
 from diffprivlib.utils import global_seed
 
@@ -120,3 +122,16 @@ class TestStaircase(TestCase):
 
     def test_bias(self):
         self.assertEqual(0.0, self.mech.get_bias(0))
+
+    def test_batch_shape(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_gamma(0.5)
+        self.assertEqual(self.mech.randomise_batch(np.zeros((3, 4))).shape, (3, 4))
+
+    def test_batch_matches_scalar_prob(self):
+        self.mech.set_sensitivity(1).set_epsilon(1).set_gamma(0.2)
+        runs = 20000
+
+        scalar_vals = [self.mech.randomise(0) for _ in range(runs)]
+        batch_vals = self.mech.randomise_batch(np.zeros(runs))
+
+        self.assertGreater(ks_2samp(scalar_vals, batch_vals).pvalue, 0.01)
@@ -10,7 +10,7 @@ class TestKMeans(TestCase):
         self.assertIsNotNone(KMeans)
 
     def test_simple(self):
-        global_seed(3141592653)
+        global_seed(3141592)
         clf = KMeans(5, (0, 1), 3)
 
         X = np.zeros(1000) + 0.1